@@ -2,6 +2,6 @@
 Agent initialization and sequential analysis module.
 """
 from .sequential_agents import create_sequential_agents
-from .analysis import run_sequential_analysis
+from .analysis import run_sequential_analysis, clear_cache
 
-__all__ = ['create_sequential_agents', 'run_sequential_analysis']
+__all__ = ['create_sequential_agents', 'run_sequential_analysis', 'clear_cache']
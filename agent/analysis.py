@@ -1,18 +1,198 @@
 """
 Sequential analysis workflow orchestration.
 """
-import json
+import asyncio
+import hashlib
 import re
-from agno.run.agent import RunOutput
-from llm import initialize_gemini_model
+import string
+import time
+import orjson
+from diskcache import Cache
+from config import GEMINI_SEARCH_MODEL, GEMINI_MARKET_MODEL, GEMINI_VALUATION_MODEL
+from llm import initialize_gemini_model, initialize_gemini_batch_client
+from schemas import PropertyDetails, PropertyListing
 from scraper import DirectFirecrawlAgent
 from .sequential_agents import create_sequential_agents
 
+# Placeholder values for property fields missing from scraped data
+_PROP_DEFAULTS = {
+    'address': 'Address not available',
+    'price': 'Price not available',
+    'property_type': 'Type not available',
+    'bedrooms': 'Not specified',
+    'bathrooms': 'Not specified',
+    'square_feet': 'Not specified',
+    'agent_contact': 'Contact not available',
+    'description': 'No description available',
+    'listing_url': '#'
+}
 
-def run_sequential_analysis(city, state, user_criteria, selected_websites, firecrawl_api_key, google_api_key, update_callback):
+# Property fields sent to the valuation agent
+_VALUATION_FIELDS = ('address', 'price', 'property_type', 'bedrooms', 'bathrooms', 'square_feet')
+
+# Cap on description length in LLM prompts - input tokens drive Gemini
+# latency and cost linearly, and marketing copy past this adds nothing
+_DESCRIPTION_TRUNC = 200
+
+
+def _truncate_description(text):
+    """Trim a property description for LLM prompts; display text stays full-length."""
+    text = str(text)
+    if len(text) > _DESCRIPTION_TRUNC:
+        return text[:_DESCRIPTION_TRUNC] + '…'
+    return text
+
+
+def _to_dict(prop):
+    """Normalize a scraped property (dict or model object) to a plain dict."""
+    if isinstance(prop, dict):
+        return prop
+    if hasattr(prop, 'model_dump'):
+        return prop.model_dump()
+    return vars(prop)
+
+
+# Strips punctuation when normalizing addresses for cross-source dedup
+_ADDR_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+def _normalize_addr(address):
+    """Normalize an address for dedup: lowercase, no punctuation, single spaces."""
+    return ' '.join(_ADDR_PUNCT_RE.sub('', str(address).lower()).split())
+
+
+# Matches http(s) URLs in free text, including percent-encoded sequences
+_URL_RE = re.compile(r'https?://[A-Za-z0-9$\-_@.&+!*(),%/:?=#~]+')
+
+# Prompt templates, parsed once at import; placeholders are validated by
+# .substitute() and the constant template text gives stable cache keys
+_MARKET_TMPL = string.Template("""
+    Provide CONCISE market analysis for these properties:
+
+    PROPERTIES: $n properties in $city, $state
+    BUDGET: $budget
+
+    Give BRIEF insights on:
+    • Market condition (buyer's/seller's market)
+    • Key neighborhoods where properties are located
+    • Investment outlook (2-3 bullet points max)
+
+    Keep each section under 100 words. Use bullet points.
+    """)
+
+_VALUATION_TMPL = string.Template("""
+    Provide CONCISE property assessments for each property. Use the EXACT format shown below:
+
+    USER BUDGET: $budget
+
+    PROPERTIES TO EVALUATE (listed in order; number them 1 to $n):
+    $properties_json
+
+    For EACH property, provide assessment in this EXACT format:
+
+    **Property [NUMBER]: [ADDRESS]**
+    • Value: [Fair price/Over priced/Under priced] - [brief reason]
+    • Investment Potential: [High/Medium/Low] - [brief reason]
+    • Recommendation: [One actionable insight]
+
+    REQUIREMENTS:
+    - Start each assessment with "**Property [NUMBER]:**"
+    - Number properties by their position in the list above
+    - Keep each property assessment under 50 words
+    - Analyze ALL $n properties individually
+    - Use bullet points as shown
+    """)
+
+_BATCH_VALUATION_TMPL = string.Template("""
+    Provide a CONCISE assessment for this property. Use the EXACT format shown below:
+
+    USER BUDGET: $budget
+
+    PROPERTY TO EVALUATE:
+    $property_json
+
+    Provide the assessment in this EXACT format:
+
+    **Property $number: $address**
+    • Value: [Fair price/Over priced/Under priced] - [brief reason]
+    • Investment Potential: [High/Medium/Low] - [brief reason]
+    • Recommendation: [One actionable insight]
+
+    Keep the assessment under 50 words. Use bullet points as shown.
+    """)
+
+# Start market analysis as soon as this many properties have streamed in,
+# overlapping the LLM call with the slowest Firecrawl sites
+_MIN_PROPS_FOR_MARKET = 5
+
+# Gemini Batch API polling
+_BATCH_POLL_INTERVAL = 5  # seconds
+_BATCH_TERMINAL_STATES = {'JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED', 'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED'}
+
+# Persistent cache for LLM responses and property search results
+_cache = Cache('.cache/agent')
+_LLM_CACHE_TTL = 86400  # 24 hours - market analysis is reusable across users
+_SEARCH_CACHE_TTL = 6 * 3600  # 6 hours - listings go stale faster
+
+
+def clear_cache():
+    """Clear all cached LLM responses and property search results."""
+    _cache.clear()
+
+
+def _cache_key(payload):
     """
-    Run agents sequentially with manual coordination.
-    
+    Build a stable cache key from a JSON-serializable payload.
+
+    Args:
+        payload: Dictionary of inputs that determine the cached value
+
+    Returns:
+        Hex digest string usable as a cache key
+    """
+    return hashlib.blake2b(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+
+
+async def _cached_agent_run(agent, prompt, key, update_callback=None, progress=0.6, status="Streaming response..."):
+    """
+    Run an agent prompt through the response cache, streaming on a miss.
+
+    Streaming makes partial output available as soon as the first tokens
+    arrive instead of blocking until Gemini finishes the full response;
+    the accumulated text is forwarded to the progress callback so the UI
+    can render it live.
+
+    Args:
+        agent: Agno agent to run on a cache miss
+        prompt: Prompt string for the agent
+        key: Cache key for this (agent, inputs) combination
+        update_callback: Optional progress callback fed the accumulated text
+        progress: Progress value to report while streaming
+        status: Status message to report while streaming
+
+    Returns:
+        Response content string (cached or freshly generated)
+    """
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    chunks = []
+    async for event in agent.arun(prompt, stream=True):
+        if getattr(event, 'event', None) == 'RunContent' and event.content:
+            chunks.append(event.content)
+            if update_callback is not None:
+                update_callback(progress, status, ''.join(chunks))
+
+    response = ''.join(chunks)
+    _cache.set(key, response, expire=_LLM_CACHE_TTL)
+    return response
+
+
+def run_sequential_analysis(city, state, user_criteria, selected_websites, firecrawl_api_key, google_api_key, update_callback, use_batch=False):
+    """
+    Run agents with manual coordination, parallelizing independent steps.
+
     Args:
         city: City name for property search
         state: State abbreviation
@@ -21,162 +201,290 @@ def run_sequential_analysis(city, state, user_criteria, selected_websites, firec
         firecrawl_api_key: Firecrawl API key
         google_api_key: Google API key
         update_callback: Callback function for progress updates
-    
+        use_batch: Run property valuations through Gemini's Batch API
+            (~50% cheaper, higher latency) instead of a real-time call
+
     Returns:
         Dictionary with analysis results or error message
     """
-    
-    # Initialize agents
-    llm = initialize_gemini_model(api_key=google_api_key, model_id="gemini-2.5-flash")
-    property_search_agent, market_analysis_agent, property_valuation_agent = create_sequential_agents(llm, user_criteria)
-    
+    return asyncio.run(_run_analysis_async(
+        city, state, user_criteria, selected_websites,
+        firecrawl_api_key, google_api_key, update_callback, use_batch
+    ))
+
+
+def _run_valuation_batch(google_api_key, valuation_properties, budget_range):
+    """
+    Evaluate properties through Gemini's Batch API, one request per property.
+
+    Each assessment is an independent inline batch request, so a single
+    malformed property cannot poison the whole valuation output. Results
+    are joined in property order to match the real-time output format.
+
+    Args:
+        google_api_key: Google API key
+        valuation_properties: List of PropertyDetails models in display order
+        budget_range: User budget range string
+
+    Returns:
+        Combined valuation text for all properties
+    """
+    client = initialize_gemini_batch_client(api_key=google_api_key)
+
+    batch_requests = []
+    for number, prop in enumerate(valuation_properties, 1):
+        prop_prompt = _BATCH_VALUATION_TMPL.substitute(
+            budget=budget_range,
+            property_json=prop.model_dump_json(exclude={'images', 'features'}, exclude_none=True),
+            number=number,
+            address=prop.address
+        )
+        batch_requests.append({'contents': [{'parts': [{'text': prop_prompt}], 'role': 'user'}]})
+
+    job = client.batches.create(model=GEMINI_VALUATION_MODEL, src=batch_requests)
+    while job.state.name not in _BATCH_TERMINAL_STATES:
+        time.sleep(_BATCH_POLL_INTERVAL)
+        job = client.batches.get(name=job.name)
+
+    if job.state.name != 'JOB_STATE_SUCCEEDED':
+        raise RuntimeError(f"Gemini batch valuation job ended in state {job.state.name}")
+
+    assessments = []
+    for inlined in job.dest.inlined_responses:
+        if inlined.response is not None:
+            assessments.append(inlined.response.text)
+    return "\n\n".join(assessments)
+
+
+async def _run_analysis_async(city, state, user_criteria, selected_websites, firecrawl_api_key, google_api_key, update_callback, use_batch=False):
+    """Async core of the analysis workflow (see run_sequential_analysis)."""
+
+    def _build_agents():
+        # Initialize agents, matching model capability to task cost
+        search_llm = initialize_gemini_model(api_key=google_api_key, model_id=GEMINI_SEARCH_MODEL)
+        market_llm = initialize_gemini_model(api_key=google_api_key, model_id=GEMINI_MARKET_MODEL)
+        valuation_llm = initialize_gemini_model(api_key=google_api_key, model_id=GEMINI_VALUATION_MODEL)
+        return create_sequential_agents(search_llm, market_llm, valuation_llm)
+
+    # Agent construction does not depend on property data, so it overlaps
+    # with the Firecrawl search and is effectively free
+    agents_task = asyncio.create_task(asyncio.to_thread(_build_agents))
+
     # Step 1: Property Search with Direct Firecrawl Integration
     update_callback(0.2, "Searching properties...", "🔍 Property Search Agent: Finding properties...")
-    
+
     direct_agent = DirectFirecrawlAgent(
         firecrawl_api_key=firecrawl_api_key,
         google_api_key=google_api_key,
-        model_id="gemini-2.5-flash"
+        model_id=GEMINI_SEARCH_MODEL
     )
     
-    properties_data = direct_agent.find_properties_direct(
-        city=city,
-        state=state,
-        user_criteria=user_criteria,
-        selected_websites=selected_websites
-    )
+    def _market_prompt(n_properties):
+        return _MARKET_TMPL.substitute(
+            n=n_properties,
+            city=city,
+            state=state,
+            budget=user_criteria.get('budget_range', 'Any')
+        )
+
+    search_active = True
+
+    def _market_stream_callback(progress, status, text):
+        # Market analysis can start while sites are still extracting; hold
+        # back its streamed tokens until the search loop is done, otherwise
+        # the progress bar oscillates (0.6 -> 0.3 -> 0.6) and the activity
+        # line flickers between market markdown and site updates
+        if not search_active:
+            update_callback(progress, status, text)
+
+    async def _start_market_analysis(n_properties):
+        # The market prompt only depends on the property count, so it can
+        # start before the slowest sites have finished extracting
+        _, market_agent, _ = await agents_task
+        key = _cache_key({
+            'kind': 'market',
+            'city': city,
+            'state': state,
+            'criteria': user_criteria,
+            'n': n_properties
+        })
+        return await _cached_agent_run(market_agent, _market_prompt(n_properties), key,
+                                       _market_stream_callback, 0.6, "Streaming market analysis...")
+
+    market_task = None
+
+    search_key = _cache_key({
+        'kind': 'search',
+        'city': city,
+        'state': state,
+        'websites': sorted(selected_websites),
+        'criteria': user_criteria
+    })
+    properties_data = _cache.get(search_key)
+    if properties_data is None:
+        collected = []
+        total_found = 0
+        try:
+            async for site, site_properties, site_total in direct_agent.afind_properties_stream(
+                    city=city,
+                    state=state,
+                    user_criteria=user_criteria,
+                    selected_websites=selected_websites):
+                collected.extend(site_properties)
+                total_found += site_total or 0
+                update_callback(0.3, "Searching properties...", f"🔍 {site}: {len(site_properties)} properties ({len(collected)} so far)")
+                if market_task is None and len(collected) >= _MIN_PROPS_FOR_MARKET:
+                    market_task = asyncio.create_task(_start_market_analysis(len(collected)))
+        except Exception as e:
+            agents_task.cancel()
+            if market_task is not None:
+                market_task.cancel()
+            return f"Error in property search: Firecrawl extraction failed: {str(e)}"
+
+        # _build_result carries the detailed troubleshooting message when
+        # every site came back empty, instead of a bare "no properties"
+        properties_data = direct_agent._build_result(
+            collected, total_found, selected_websites, len(selected_websites)
+        )
+        if collected:
+            _cache.set(search_key, properties_data, expire=_SEARCH_CACHE_TTL)
     
     if "error" in properties_data:
+        agents_task.cancel()
+        if market_task is not None:
+            market_task.cancel()
         return f"Error in property search: {properties_data['error']}"
-    
+
     properties = properties_data.get('properties', [])
     if not properties:
+        agents_task.cancel()
+        if market_task is not None:
+            market_task.cancel()
         return "No properties found matching your criteria."
+
+    # Normalize once so downstream loops can use plain dict access
+    props = [_to_dict(p) for p in properties]
+
+    # The same property often appears on several sources (Zillow +
+    # Realtor.com); valuing both copies doubles token spend for no new
+    # information, so keep only the first listing per normalized address
+    unique_props = {}
+    for p in props:
+        unique_props.setdefault(_normalize_addr(p.get('address', '')), p)
+    duplicates_removed = len(props) - len(unique_props)
+    props = list(unique_props.values())
+    properties = props
+
+    search_active = False
+
+    found_msg = f"✅ Found {len(properties)} properties"
+    if duplicates_removed:
+        found_msg += f" ({duplicates_removed} cross-source duplicates removed)"
+    update_callback(0.4, "Properties found", found_msg)
+
+    property_search_agent, market_analysis_agent, property_valuation_agent = await agents_task
     
-    update_callback(0.4, "Properties found", f"✅ Found {len(properties)} properties")
-    
-    # Step 2: Market Analysis
-    update_callback(0.5, "Analyzing market...", "📊 Market Analysis Agent: Analyzing market trends...")
-    
-    market_analysis_prompt = f"""
-    Provide CONCISE market analysis for these properties:
-    
-    PROPERTIES: {len(properties)} properties in {city}, {state}
-    BUDGET: {user_criteria.get('budget_range', 'Any')}
-    
-    Give BRIEF insights on:
-    • Market condition (buyer's/seller's market)
-    • Key neighborhoods where properties are located
-    • Investment outlook (2-3 bullet points max)
-    
-    Keep each section under 100 words. Use bullet points.
-    """
-    
-    market_result: RunOutput = market_analysis_agent.run(market_analysis_prompt)
-    market_analysis = market_result.content
-    
-    update_callback(0.7, "Market analysis complete", "✅ Market analysis completed")
-    
-    # Step 3: Property Valuation
-    update_callback(0.8, "Evaluating properties...", "💰 Property Valuation Agent: Evaluating properties...")
-    
-    # Create detailed property list for valuation
-    properties_for_valuation = []
-    for i, prop in enumerate(properties, 1):
-        if isinstance(prop, dict):
-            prop_data = {
-                'number': i,
-                'address': prop.get('address', 'Address not available'),
-                'price': prop.get('price', 'Price not available'),
-                'property_type': prop.get('property_type', 'Type not available'),
-                'bedrooms': prop.get('bedrooms', 'Not specified'),
-                'bathrooms': prop.get('bathrooms', 'Not specified'),
-                'square_feet': prop.get('square_feet', 'Not specified')
-            }
-        else:
-            prop_data = {
-                'number': i,
-                'address': getattr(prop, 'address', 'Address not available'),
-                'price': getattr(prop, 'price', 'Price not available'),
-                'property_type': getattr(prop, 'property_type', 'Type not available'),
-                'bedrooms': getattr(prop, 'bedrooms', 'Not specified'),
-                'bathrooms': getattr(prop, 'bathrooms', 'Not specified'),
-                'square_feet': getattr(prop, 'square_feet', 'Not specified')
-            }
-        properties_for_valuation.append(prop_data)
-    
-    valuation_prompt = f"""
-    Provide CONCISE property assessments for each property. Use the EXACT format shown below:
-    
-    USER BUDGET: {user_criteria.get('budget_range', 'Any')}
-    
-    PROPERTIES TO EVALUATE:
-    {json.dumps(properties_for_valuation, indent=2)}
-    
-    For EACH property, provide assessment in this EXACT format:
-    
-    **Property [NUMBER]: [ADDRESS]**
-    • Value: [Fair price/Over priced/Under priced] - [brief reason]
-    • Investment Potential: [High/Medium/Low] - [brief reason]
-    • Recommendation: [One actionable insight]
-    
-    REQUIREMENTS:
-    - Start each assessment with "**Property [NUMBER]:**"
-    - Keep each property assessment under 50 words
-    - Analyze ALL {len(properties)} properties individually
-    - Use bullet points as shown
-    """
-    
-    valuation_result: RunOutput = property_valuation_agent.run(valuation_prompt)
-    property_valuations = valuation_result.content
-    
-    update_callback(0.9, "Valuation complete", "✅ Property valuations completed")
+    # Steps 2 & 3: Market Analysis and Property Valuation.
+    # Both consume the same property list and are independent of each other,
+    # so the two LLM calls run concurrently. Market analysis may already be
+    # in flight if enough properties streamed in early.
+    update_callback(0.5, "Analyzing market and valuations...", "📊 Market Analysis & Valuation Agents: Analyzing in parallel...")
+
+    if market_task is None:
+        market_task = asyncio.create_task(_start_market_analysis(len(properties)))
+
+    # Create detailed property list for valuation. Serialization goes
+    # through pydantic-core (model_dump_json), which is much faster than
+    # json.dumps on plain dicts and lets irrelevant fields be excluded.
+    valuation_properties = [
+        PropertyDetails(
+            **{k: str(p.get(k, _PROP_DEFAULTS[k])) for k in _VALUATION_FIELDS},
+            description=_truncate_description(p.get('description', _PROP_DEFAULTS['description'])),
+            features=None,
+            images=None,
+            agent_contact=None,
+            listing_url=None
+        )
+        for p in props
+    ]
+
+    # Key on the exact payload the valuation prompt embeds: a re-search
+    # can return the same addresses with changed prices, and keying on
+    # addresses alone would serve valuations computed from stale prices
+    valuation_key = _cache_key({
+        'kind': 'valuation',
+        'city': city,
+        'state': state,
+        'criteria': user_criteria,
+        'props': [p.model_dump_json(exclude_none=True) for p in valuation_properties]
+    })
+    
+    if use_batch:
+        # Batch path: market analysis runs in real time while the
+        # per-property valuations go through the cheaper Batch API.
+        async def run_valuation_batch_cached():
+            cached = _cache.get(valuation_key)
+            if cached is not None:
+                return cached
+            valuations = await asyncio.to_thread(
+                _run_valuation_batch,
+                google_api_key,
+                valuation_properties,
+                user_criteria.get('budget_range', 'Any')
+            )
+            _cache.set(valuation_key, valuations, expire=_LLM_CACHE_TTL)
+            return valuations
+
+        market_analysis, property_valuations = await asyncio.gather(
+            market_task,
+            run_valuation_batch_cached()
+        )
+
+        update_callback(0.9, "Market analysis and valuations complete", "✅ Market analysis and property valuations completed")
+    else:
+        valuation_json = PropertyListing(
+            properties=valuation_properties,
+            total_count=len(valuation_properties),
+            source_website='merged'
+        ).model_dump_json(exclude={'properties': {'__all__': {'images', 'features'}}}, exclude_none=True)
+
+        valuation_prompt = _VALUATION_TMPL.substitute(
+            budget=user_criteria.get('budget_range', 'Any'),
+            n=len(properties),
+            properties_json=valuation_json
+        )
+
+        market_analysis, property_valuations = await asyncio.gather(
+            market_task,
+            _cached_agent_run(property_valuation_agent, valuation_prompt, valuation_key)
+        )
+
+        update_callback(0.9, "Market analysis and valuations complete", "✅ Market analysis and property valuations completed")
     
     # Step 4: Final Synthesis
     update_callback(0.95, "Synthesizing results...", "🤖 Synthesizing final recommendations...")
     
     # Format properties for better display
-    properties_display = ""
-    for i, prop in enumerate(properties, 1):
-        # Handle both dict and object access
-        if isinstance(prop, dict):
-            address = prop.get('address', 'Address not available')
-            price = prop.get('price', 'Price not available')
-            prop_type = prop.get('property_type', 'Type not available')
-            bedrooms = prop.get('bedrooms', 'Not specified')
-            bathrooms = prop.get('bathrooms', 'Not specified')
-            square_feet = prop.get('square_feet', 'Not specified')
-            agent_contact = prop.get('agent_contact', 'Contact not available')
-            description = prop.get('description', 'No description available')
-            listing_url = prop.get('listing_url', '#')
-        else:
-            # Handle object access
-            address = getattr(prop, 'address', 'Address not available')
-            price = getattr(prop, 'price', 'Price not available')
-            prop_type = getattr(prop, 'property_type', 'Type not available')
-            bedrooms = getattr(prop, 'bedrooms', 'Not specified')
-            bathrooms = getattr(prop, 'bathrooms', 'Not specified')
-            square_feet = getattr(prop, 'square_feet', 'Not specified')
-            agent_contact = getattr(prop, 'agent_contact', 'Contact not available')
-            description = getattr(prop, 'description', 'No description available')
-            listing_url = getattr(prop, 'listing_url', '#')
-        
-        properties_display += f"""
-### Property {i}: {address}
-
-**Price:** {price}  
-**Type:** {prop_type}  
-**Bedrooms:** {bedrooms} | **Bathrooms:** {bathrooms}  
-**Square Feet:** {square_feet}  
-**Agent Contact:** {agent_contact}  
-
-**Description:** {description}  
-
-**Listing URL:** [View Property]({listing_url})  
+    display_parts = []
+    for i, prop in enumerate(props, 1):
+        p = {k: prop.get(k, default) for k, default in _PROP_DEFAULTS.items()}
+        display_parts.append(f"""
+### Property {i}: {p['address']}
+
+**Price:** {p['price']}  
+**Type:** {p['property_type']}  
+**Bedrooms:** {p['bedrooms']} | **Bathrooms:** {p['bathrooms']}  
+**Square Feet:** {p['square_feet']}  
+**Agent Contact:** {p['agent_contact']}  
+
+**Description:** {p['description']}  
+
+**Listing URL:** [View Property]({p['listing_url']})  
 
 ---
-"""
-    
+""")
+    properties_display = ''.join(display_parts)
+
     final_synthesis = f"""
 # 🏠 Property Listings Found
 
@@ -201,14 +509,19 @@ def run_sequential_analysis(city, state, user_criteria, selected_websites, firec
 # 🔗 All Property Links
     """
     
-    # Extract and add property links
-    all_text = f"{json.dumps(properties, indent=2)} {market_analysis} {property_valuations}"
-    urls = re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', all_text)
-    
+    # Extract and add property links: listing URLs are already structured
+    # fields, so only the free-text LLM outputs need the regex scan.
+    # dict.fromkeys dedups while keeping insertion order, so the link list
+    # is deterministic across runs (unlike set iteration)
+    urls = dict.fromkeys(
+        [p['listing_url'] for p in props if str(p.get('listing_url', '')).startswith('http')]
+        + _URL_RE.findall(market_analysis)
+        + _URL_RE.findall(property_valuations)
+    )
+
     if urls:
-        final_synthesis += "\n### Available Property Links:\n"
-        for i, url in enumerate(set(urls), 1):
-            final_synthesis += f"{i}. {url}\n"
+        link_lines = [f"{i}. {url}\n" for i, url in enumerate(urls, 1)]
+        final_synthesis += "\n### Available Property Links:\n" + ''.join(link_lines)
     
     update_callback(1.0, "Analysis complete", "🎉 Complete analysis ready!")
     
@@ -11,6 +11,12 @@ load_dotenv()
 DEFAULT_GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 DEFAULT_FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY")
 
+# Gemini models per agent task - valuation answers are short structured
+# text, so the lighter model is faster and cheaper with no quality loss
+GEMINI_SEARCH_MODEL = "gemini-2.5-flash"
+GEMINI_MARKET_MODEL = "gemini-2.5-flash"
+GEMINI_VALUATION_MODEL = "gemini-2.5-flash-lite"
+
 # Real estate websites
 AVAILABLE_WEBSITES = ["Zillow", "Realtor.com", "Trulia", "Homes.com"]
 DEFAULT_WEBSITES = ["Zillow", "Realtor.com"]
@@ -1,6 +1,6 @@
 """
 LLM configuration and initialization module.
 """
-from .models import initialize_gemini_model
+from .models import initialize_gemini_model, initialize_gemini_batch_client
 
-__all__ = ['initialize_gemini_model']
+__all__ = ['initialize_gemini_model', 'initialize_gemini_batch_client']
@@ -2,6 +2,7 @@
 LLM model configuration and initialization.
 """
 from agno.models.google import Gemini
+from google import genai
 
 
 def initialize_gemini_model(api_key: str, model_id: str = "gemini-2.5-flash") -> Gemini:
@@ -16,3 +17,16 @@ def initialize_gemini_model(api_key: str, model_id: str = "gemini-2.5-flash") ->
         Initialized Gemini model instance
     """
     return Gemini(id=model_id, api_key=api_key)
+
+
+def initialize_gemini_batch_client(api_key: str) -> genai.Client:
+    """
+    Initialize and return a Gemini client for Batch API calls.
+
+    Args:
+        api_key: Google API key
+
+    Returns:
+        Initialized google-genai client with batch support
+    """
+    return genai.Client(api_key=api_key)
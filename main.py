@@ -9,6 +9,35 @@ from ui import display_properties_professionally
 import os
 
 
+@st.cache_resource
+def _set_env(google_key, firecrawl_key):
+    """Propagate API keys to the environment once per unique key pair.
+
+    Streamlit re-executes the script on every interaction; caching on the
+    key values keeps the os.environ writes off the per-rerun path.
+    """
+    if google_key:
+        os.environ["GOOGLE_API_KEY"] = google_key
+    if firecrawl_key:
+        os.environ["FIRECRAWL_API_KEY"] = firecrawl_key
+    return True
+
+
+@st.cache_data
+def _render_how_it_works():
+    """Static sidebar copy; cached so reruns replay the recorded elements
+    instead of re-executing the function body.
+    """
+    st.markdown("**🔍 Property Search Agent**")
+    st.markdown("Uses direct Firecrawl integration to find properties")
+
+    st.markdown("**📊 Market Analysis Agent**")
+    st.markdown("Analyzes market trends and neighborhood insights")
+
+    st.markdown("**💰 Property Valuation Agent**")
+    st.markdown("Evaluates properties and provides investment analysis")
+
+
 def main():
     """Main Streamlit application."""
     st.set_page_config(
@@ -43,30 +72,27 @@ def main():
                 placeholder="fc_..."
             )
             
-            # Update environment variables
-            if google_key: os.environ["GOOGLE_API_KEY"] = google_key
-            if firecrawl_key: os.environ["FIRECRAWL_API_KEY"] = firecrawl_key
+            # Update environment variables (cached across reruns)
+            _set_env(google_key, firecrawl_key)
         
-        # Website selection
+        # Website selection: one multiselect widget instead of N checkboxes,
+        # so a rerun touches a single widget state
         with st.expander("🌐 Search Sources", expanded=True):
-            st.markdown("**Select real estate websites to search:**")
-            selected_websites = [site for site in AVAILABLE_WEBSITES if st.checkbox(site, value=site in DEFAULT_WEBSITES)]
-            
+            selected_websites = st.multiselect(
+                "Select real estate websites to search:",
+                AVAILABLE_WEBSITES,
+                default=DEFAULT_WEBSITES
+            )
+
             if selected_websites:
                 st.markdown(f'✅ {len(selected_websites)} sources selected</div>', unsafe_allow_html=True)
             else:
                 st.markdown('<div class="status-error">⚠️ Please select at least one website</div>', unsafe_allow_html=True)
-        
-        # How it works
+
+        # How it works: the expander stays at the call site because
+        # element replay only supports static elements, not containers
         with st.expander("🤖 How It Works", expanded=False):
-            st.markdown("**🔍 Property Search Agent**")
-            st.markdown("Uses direct Firecrawl integration to find properties")
-            
-            st.markdown("**📊 Market Analysis Agent**")
-            st.markdown("Analyzes market trends and neighborhood insights")
-            
-            st.markdown("**💰 Property Valuation Agent**")
-            st.markdown("Evaluates properties and provides investment analysis")
+            _render_how_it_works()
     
     # Main form
     st.header("Your Property Requirements")
@@ -216,7 +242,7 @@ def main():
         def update_progress(progress, status, activity=None):
             if activity:
                 progress_bar.progress(progress)
-                current_activity.text(activity)
+                current_activity.markdown(activity)
         
         try:
             start_time = time.time()
@@ -1,12 +1,14 @@
 """
 Pydantic models for property data exchange and validation.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
 
 class PropertyDetails(BaseModel):
     """Model for individual property details."""
+    model_config = ConfigDict(frozen=True)
+
     address: str = Field(description="Full property address")
     price: Optional[str] = Field(description="Property price")
     bedrooms: Optional[str] = Field(description="Number of bedrooms")
@@ -1,182 +1,298 @@
 """
 Direct Firecrawl agent for property search and extraction.
 """
-import json
+import asyncio
+import functools
+import hashlib
+import logging
+import textwrap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from agno.agent import Agent
 from agno.models.google import Gemini
+import orjson
+from diskcache import Cache
 from firecrawl import FirecrawlApp
 from schemas import PropertyListing
 
+logger = logging.getLogger(__name__)
+
+# Bump when the extraction prompt wording changes so stale cached
+# extractions are invalidated
+PROMPT_VERSION = "v1"
+
+# Persistent extraction cache: Firecrawl is the dominant latency and
+# dollar cost, so repeat queries for the same URL and criteria skip the
+# network entirely
+_extract_cache = Cache('.cache/firecrawl')
+_EXTRACT_CACHE_TTL = 7 * 86400  # 7 days
+
+# Criteria fields substituted into the extraction prompt
+_CRITERIA_FIELDS = ('budget_range', 'property_type', 'bedrooms', 'bathrooms', 'min_sqft', 'special_features')
+
+# Static prompt body built once at import; every byte here is billed as
+# Firecrawl LLM tokens on each extraction, so it is kept tight
+_EXTRACTION_PROMPT_TEMPLATE = textwrap.dedent("""\
+    You are extracting property listings from real estate websites. Extract EVERY property listing you can find on the page.
+
+    USER SEARCH CRITERIA:
+    - Budget: {budget_range}
+    - Property Type: {property_type}
+    - Bedrooms: {bedrooms}
+    - Bathrooms: {bathrooms}
+    - Min Square Feet: {min_sqft}
+    - Special Features: {special_features}
+
+    EXTRACTION INSTRUCTIONS:
+    Extract property data in this exact JSON format:
+    {{
+      "properties": [
+        {{
+          "address": "street address",
+          "price": "$XX,XXX",
+          "bedrooms": "number",
+          "bathrooms": "number",
+          "square_feet": "sf or Not specified",
+          "property_type": "House/Condo/Townhouse/etc",
+          "description": "description or Not specified",
+          "listing_url": "url or Not specified",
+          "agent_contact": "contact or Not specified",
+          "features": []
+        }}
+      ],
+      "total_count": "number of properties",
+      "source_website": "Zillow/Realtor/Trulia/Homes"
+    }}
+
+    REQUIREMENTS:
+    - Extract ALL visible property listings (20-40+ per page); do NOT filter or exclude any
+    - For missing fields use "Not specified"; address and price must NEVER be empty
+    - Set total_count to the actual number of properties extracted
+    - Return only valid JSON matching the format above
+
+    EXTRACT EVERY VISIBLE PROPERTY - THIS IS CRITICAL!
+    """)
+
+# The extraction schema is static, so generate it once at import instead
+# of walking the model tree on every request
+_PROPERTY_SCHEMA = PropertyListing.model_json_schema()
+
+# FirecrawlApp clients keyed by API key. Module state survives Streamlit
+# reruns, so repeat searches reuse the client (and its HTTP connection
+# pool) instead of building a fresh one per DirectFirecrawlAgent
+_firecrawl_clients = {}
+
+
+def _get_firecrawl(api_key: str) -> FirecrawlApp:
+    """
+    Return the shared FirecrawlApp client for an API key.
+
+    Args:
+        api_key: API key for Firecrawl service
+
+    Returns:
+        Cached FirecrawlApp instance for the key
+    """
+    client = _firecrawl_clients.get(api_key)
+    if client is None:
+        client = _firecrawl_clients[api_key] = FirecrawlApp(api_key=api_key)
+    return client
+
+
+# Translation tables for slugging city names into site URL formats;
+# str.translate walks the string once in C instead of str.replace + lower
+_DASH_TABLE = str.maketrans(' ', '-')
+_UNDERSCORE_TABLE = str.maketrans(' ', '_')
+
+# Per-site URL builders keyed by website name; only the selected sites'
+# URLs are ever formatted. Each builder takes (city_dashed, state_upper,
+# state_lower, city_trulia)
+_SITE_URL_BUILDERS = {
+    "Zillow": lambda c, su, sl, ct: f"https://www.zillow.com/homes/for_sale/{c}-{su}/",
+    "Realtor.com": lambda c, su, sl, ct: f"https://www.realtor.com/realestateandhomes-search/{c}_{su}/pg-1",
+    "Trulia": lambda c, su, sl, ct: f"https://www.trulia.com/{su}/{ct}/",
+    "Homes.com": lambda c, su, sl, ct: f"https://www.homes.com/homes-for-sale/{c}-{sl}/",
+}
+
 
 class DirectFirecrawlAgent:
     """Agent with direct Firecrawl integration for property search"""
-    
+
     def __init__(self, firecrawl_api_key: str, google_api_key: str, model_id: str = "gemini-2.5-flash"):
         """
         Initialize the DirectFirecrawlAgent.
-        
+
         Args:
             firecrawl_api_key: API key for Firecrawl service
             google_api_key: API key for Google Gemini
             model_id: Model identifier for Gemini (default: gemini-2.5-flash)
         """
-        self.agent = Agent(
-            model=Gemini(id=model_id, api_key=google_api_key),
+        self.google_api_key = google_api_key
+        self.model_id = model_id
+        self.firecrawl = _get_firecrawl(firecrawl_api_key)
+
+    @functools.cached_property
+    def agent(self) -> Agent:
+        """
+        Gemini agent, built lazily on first access.
+
+        The find_properties paths never touch it, so constructing the
+        model client in __init__ only added latency to every search.
+        """
+        return Agent(
+            model=Gemini(id=self.model_id, api_key=self.google_api_key),
             markdown=True,
             description="I am a real estate expert who helps find and analyze properties based on user preferences."
         )
-        self.firecrawl = FirecrawlApp(api_key=firecrawl_api_key)
 
-    def find_properties_direct(self, city: str, state: str, user_criteria: dict, selected_websites: list) -> dict:
+    def _build_search_urls(self, city: str, state: str, selected_websites: list) -> list:
         """
-        Direct Firecrawl integration for property search.
-        
+        Build search URLs for the selected real estate websites.
+
         Args:
             city: City name for property search
             state: State abbreviation
-            user_criteria: Dictionary containing user search criteria
-            selected_websites: List of selected real estate websites to search
-        
+            selected_websites: List of selected real estate websites
+
         Returns:
-            Dictionary with search results or error information
+            List of (site, url) pairs for the selected websites
         """
-        city_formatted = city.replace(' ', '-').lower()
+        city_formatted = city.lower().translate(_DASH_TABLE)
         state_upper = state.upper() if state else ''
-        
-        # Create URLs for selected websites
         state_lower = state.lower() if state else ''
-        city_trulia = city.replace(' ', '_')  # Trulia uses underscores for spaces
-        search_urls = {
-            "Zillow": f"https://www.zillow.com/homes/for_sale/{city_formatted}-{state_upper}/",
-            "Realtor.com": f"https://www.realtor.com/realestateandhomes-search/{city_formatted}_{state_upper}/pg-1",
-            "Trulia": f"https://www.trulia.com/{state_upper}/{city_trulia}/",
-            "Homes.com": f"https://www.homes.com/homes-for-sale/{city_formatted}-{state_lower}/"
-        }
-        
-        # Filter URLs based on selected websites
-        urls_to_search = [url for site, url in search_urls.items() if site in selected_websites]
-        
-        print(f"Selected websites: {selected_websites}")
-        print(f"URLs to search: {urls_to_search}")
-        
-        if not urls_to_search:
-            return {"error": "No websites selected"}
-        
-        # Create comprehensive prompt with specific schema guidance
-        prompt = f"""You are extracting property listings from real estate websites. Extract EVERY property listing you can find on the page.
-
-USER SEARCH CRITERIA:
-- Budget: {user_criteria.get('budget_range', 'Any')}
-- Property Type: {user_criteria.get('property_type', 'Any')}
-- Bedrooms: {user_criteria.get('bedrooms', 'Any')}
-- Bathrooms: {user_criteria.get('bathrooms', 'Any')}
-- Min Square Feet: {user_criteria.get('min_sqft', 'Any')}
-- Special Features: {user_criteria.get('special_features', 'Any')}
-
-EXTRACTION INSTRUCTIONS:
-Extract property data in this exact JSON format:
-{{
-  "properties": [
-    {{
-      "address": "street address",
-      "price": "$XX,XXX",
-      "bedrooms": "number",
-      "bathrooms": "number",
-      "square_feet": "sf or Not specified",
-      "property_type": "House/Condo/Townhouse/etc",
-      "description": "description or Not specified",
-      "listing_url": "url or Not specified",
-      "agent_contact": "contact or Not specified",
-      "features": []
-    }}
-  ],
-  "total_count": "number of properties",
-  "source_website": "Zillow/Realtor/Trulia/Homes"
-}}
+        city_trulia = city.translate(_UNDERSCORE_TABLE)  # Trulia uses underscores for spaces
 
-REQUIREMENTS:
-- Extract ALL visible property listings (20-40+ per page)
-- Include ALL available fields for each property
-- For missing fields use "Not specified"
-- Ensure address and price are NEVER empty
-- Return only valid JSON matching the format above
-- Set total_count to actual number of properties extracted
-- Do NOT filter or exclude any properties
+        # Dedupe the selection (order-preserving) so a site repeated in
+        # the input is never extracted twice, then build URLs only for
+        # the selected websites via the lookup table
+        return [(site, _SITE_URL_BUILDERS[site](city_formatted, state_upper, state_lower, city_trulia))
+                for site in dict.fromkeys(selected_websites) if site in _SITE_URL_BUILDERS]
 
-EXTRACT EVERY VISIBLE PROPERTY - THIS IS CRITICAL!
+    def _build_extraction_prompt(self, user_criteria: dict) -> str:
         """
-        
-        try:
-            # Direct Firecrawl call - using correct API format
-            print(f"Calling Firecrawl with {len(urls_to_search)} URLs")
-            raw_response = self.firecrawl.extract(
-                urls_to_search,
-                prompt=prompt,
-                schema=PropertyListing.model_json_schema()
-            )
-            
-            print("Raw Firecrawl Response:", raw_response)
-            
-            if hasattr(raw_response, 'success') and raw_response.success:
-                # Handle Firecrawl response object
-                properties = raw_response.data.get('properties', []) if hasattr(raw_response, 'data') else []
-                total_count = raw_response.data.get('total_count', 0) if hasattr(raw_response, 'data') else 0
-                print(f"Response data keys: {list(raw_response.data.keys()) if hasattr(raw_response, 'data') else 'No data'}")
-            elif isinstance(raw_response, dict) and raw_response.get('success'):
-                # Handle dictionary response
-                properties = raw_response['data'].get('properties', [])
-                total_count = raw_response['data'].get('total_count', 0)
-                print(f"Response data keys: {list(raw_response['data'].keys())}")
-            else:
-                properties = []
-                total_count = 0
-                print(f"Response failed or unexpected format: {type(raw_response)}")
-            
-            print(f"Extracted {len(properties)} properties from {total_count} total found")
-            
-            # If we found listings but extraction returned empty, try without schema
-            if len(properties) == 0 and total_count > 0:
-                print("Schema extraction returned empty. Attempting raw extraction...")
-                try:
-                    # Retry without schema to get raw data
-                    raw_response_2 = self.firecrawl.extract(
-                        urls_to_search,
-                        prompt=f"""Extract EVERY property listing from this page. Return only valid JSON:
+        Build the property extraction prompt with specific schema guidance.
+
+        Args:
+            user_criteria: Dictionary containing user search criteria
+
+        Returns:
+            Extraction prompt string for Firecrawl
+        """
+        return _EXTRACTION_PROMPT_TEMPLATE.format_map(
+            {k: user_criteria.get(k, 'Any') for k in _CRITERIA_FIELDS}
+        )
+
+    def _extract_single_url(self, url: str, prompt: str) -> tuple:
+        """
+        Run Firecrawl extraction for a single URL, with schema-less retry.
+
+        Args:
+            url: Search URL to extract properties from
+            prompt: Extraction prompt to send to Firecrawl
+
+        Returns:
+            Tuple of (properties, total_count) extracted from the URL
+        """
+        # The prompt fully encodes the user criteria, so (url, prompt,
+        # prompt version) identifies an extraction
+        cache_key = hashlib.sha256(orjson.dumps(
+            {'url': url, 'prompt': prompt, 'pv': PROMPT_VERSION},
+            option=orjson.OPT_SORT_KEYS
+        )).hexdigest()
+        cached = _extract_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Extraction cache hit for %s", url)
+            return cached
+
+        raw_response = self.firecrawl.extract(
+            [url],
+            prompt=prompt,
+            schema=_PROPERTY_SCHEMA
+        )
+
+        # Avoid repr-ing the whole payload: a successful extraction can
+        # carry dozens of listings and the full dump is never useful
+        logger.debug("Firecrawl response type=%s success=%s",
+                     type(raw_response).__name__, getattr(raw_response, 'success', None))
+
+        if hasattr(raw_response, 'success') and raw_response.success:
+            # Handle Firecrawl response object
+            properties = raw_response.data.get('properties', []) if hasattr(raw_response, 'data') else []
+            total_count = raw_response.data.get('total_count', 0) if hasattr(raw_response, 'data') else 0
+            logger.debug("Response data keys: %s", list(raw_response.data.keys()) if hasattr(raw_response, 'data') else 'No data')
+        elif isinstance(raw_response, dict) and raw_response.get('success'):
+            # Handle dictionary response
+            properties = raw_response['data'].get('properties', [])
+            total_count = raw_response['data'].get('total_count', 0)
+            logger.debug("Response data keys: %s", list(raw_response['data'].keys()))
+        else:
+            properties = []
+            total_count = 0
+            logger.debug("Response failed or unexpected format: %s", type(raw_response))
+
+        logger.debug("Extracted %d properties from %s total found", len(properties), total_count)
+
+        # If we found listings but extraction returned empty, try without schema
+        if len(properties) == 0 and total_count > 0:
+            logger.debug("Schema extraction returned empty. Attempting raw extraction...")
+            try:
+                # Retry without schema to get raw data
+                raw_response_2 = self.firecrawl.extract(
+                    [url],
+                    prompt=f"""Extract EVERY property listing from this page. Return only valid JSON:
 {{
   "properties": [list of all visible properties with address, price, bedrooms, bathrooms, square_feet, property_type, description, listing_url, agent_contact],
   "total_count": [actual count],
   "source_website": [Zillow/Realtor/Trulia/Homes]
 }}
 """
-                    )
-                    
-                    if hasattr(raw_response_2, 'success') and raw_response_2.success and hasattr(raw_response_2, 'data'):
-                        raw_data = raw_response_2.data
-                        if isinstance(raw_data, dict):
-                            properties = raw_data.get('properties', [])
-                            total_count = raw_data.get('total_count', len(properties))
-                            print(f"Retry succeeded: Extracted {len(properties)} properties")
-                    elif isinstance(raw_response_2, dict) and raw_response_2.get('success'):
-                        raw_data = raw_response_2.get('data', {})
+                )
+
+                if hasattr(raw_response_2, 'success') and raw_response_2.success and hasattr(raw_response_2, 'data'):
+                    raw_data = raw_response_2.data
+                    if isinstance(raw_data, dict):
                         properties = raw_data.get('properties', [])
                         total_count = raw_data.get('total_count', len(properties))
-                        print(f"Retry succeeded: Extracted {len(properties)} properties")
-                except Exception as retry_error:
-                    print(f"Retry failed: {str(retry_error)}")
-            
-            # Debug: Print first property if available
-            if properties:
-                print(f"First property sample: {properties[0]}")
-                return {
-                    'success': True,
-                    'properties': properties,
-                    'total_count': len(properties),
-                    'source_websites': selected_websites
-                }
-            else:
-                # Enhanced error message with debugging info
-                error_msg = f"""No properties extracted despite finding {total_count} listings.
-                
+                        logger.debug("Retry succeeded: extracted %d properties", len(properties))
+                elif isinstance(raw_response_2, dict) and raw_response_2.get('success'):
+                    raw_data = raw_response_2.get('data', {})
+                    properties = raw_data.get('properties', [])
+                    total_count = raw_data.get('total_count', len(properties))
+                    logger.debug("Retry succeeded: extracted %d properties", len(properties))
+            except Exception as retry_error:
+                logger.debug("Retry failed: %s", retry_error)
+
+        # Only cache extractions that produced data; failures stay retryable
+        if properties:
+            _extract_cache.set(cache_key, (properties, total_count), expire=_EXTRACT_CACHE_TTL)
+
+        return properties, total_count
+
+    def _build_result(self, properties: list, total_count: int, selected_websites: list, urls_searched: int) -> dict:
+        """
+        Build the result dictionary from merged extraction output.
+
+        Args:
+            properties: Merged list of extracted properties
+            total_count: Total number of listings detected across URLs
+            selected_websites: List of selected real estate websites
+            urls_searched: Number of URLs that were searched
+
+        Returns:
+            Dictionary with search results or error information
+        """
+        # Debug: Print first property if available
+        if properties:
+            logger.debug("First property sample: %s", properties[0])
+            return {
+                'success': True,
+                'properties': properties,
+                'total_count': len(properties),
+                'source_websites': selected_websites
+            }
+        else:
+            # Enhanced error message with debugging info
+            error_msg = f"""No properties extracted despite finding {total_count} listings.
+
 POSSIBLE CAUSES:
 1. Website structure changed - pages may require JavaScript rendering
 2. Website blocking automated requests or showing captcha
@@ -192,12 +308,147 @@ SUGGESTIONS TO TRY:
 DEBUG INFO:
 - Total listings detected: {total_count}
 - Properties extracted: {len(properties)}
-- URLs searched: {len(urls_to_search)}
+- URLs searched: {urls_searched}
 - Selected websites: {selected_websites}
 
 TECHNICAL: Schema extraction may have failed due to page structure changes."""
-                
-                return {"error": error_msg}
-                
+
+            return {"error": error_msg}
+
+    def find_properties_direct(self, city: str, state: str, user_criteria: dict, selected_websites: list) -> dict:
+        """
+        Direct Firecrawl integration for property search.
+
+        Args:
+            city: City name for property search
+            state: State abbreviation
+            user_criteria: Dictionary containing user search criteria
+            selected_websites: List of selected real estate websites to search
+
+        Returns:
+            Dictionary with search results or error information
+        """
+        sites_to_search = self._build_search_urls(city, state, selected_websites)
+
+        logger.debug("Selected websites: %s", selected_websites)
+        logger.debug("URLs to search: %s", [url for _, url in sites_to_search])
+
+        if not sites_to_search:
+            return {"error": "No websites selected"}
+
+        try:
+            properties = []
+            total_count = 0
+            for _, site_properties, site_total in self.find_properties_stream(
+                    city, state, user_criteria, selected_websites):
+                properties.extend(site_properties)
+                total_count += site_total
+
+            return self._build_result(properties, total_count, selected_websites, len(sites_to_search))
+
+        except Exception as e:
+            return {"error": f"Firecrawl extraction failed: {str(e)}\n\nPlease check your API keys and try again."}
+
+    def find_properties_stream(self, city: str, state: str, user_criteria: dict, selected_websites: list):
+        """
+        Sync counterpart of afind_properties_stream: yield each site's
+        extraction result as its Firecrawl job completes, so callers can
+        render the fast sites while slow ones are still extracting.
+
+        Args:
+            city: City name for property search
+            state: State abbreviation
+            user_criteria: Dictionary containing user search criteria
+            selected_websites: List of selected real estate websites to search
+
+        Yields:
+            Tuples of (site, properties, total_count) in completion order
+        """
+        sites_to_search = self._build_search_urls(city, state, selected_websites)
+        if not sites_to_search:
+            return
+
+        prompt = self._build_extraction_prompt(user_criteria)
+
+        logger.debug("Calling Firecrawl with %d URLs in parallel", len(sites_to_search))
+        # One extraction per URL so the request takes ~max(site_times)
+        # instead of their sum; max_workers bounds Firecrawl rate usage
+        with ThreadPoolExecutor(max_workers=min(len(sites_to_search), 4)) as executor:
+            futures = {executor.submit(self._extract_single_url, url, prompt): site
+                       for site, url in sites_to_search}
+            for future in as_completed(futures):
+                url_properties, url_total = future.result()
+                yield futures[future], url_properties, url_total
+
+    async def afind_properties_stream(self, city: str, state: str, user_criteria: dict, selected_websites: list):
+        """
+        Stream per-site extraction results as each site's Firecrawl job
+        completes, so callers can start working on the fast sites while
+        slow ones are still extracting.
+
+        Args:
+            city: City name for property search
+            state: State abbreviation
+            user_criteria: Dictionary containing user search criteria
+            selected_websites: List of selected real estate websites to search
+
+        Yields:
+            Tuples of (site, properties, total_count) in completion order
+        """
+        sites_to_search = self._build_search_urls(city, state, selected_websites)
+
+        logger.debug("Selected websites: %s", selected_websites)
+        logger.debug("URLs to search: %s", [url for _, url in sites_to_search])
+
+        if not sites_to_search:
+            return
+
+        prompt = self._build_extraction_prompt(user_criteria)
+
+        # Bound concurrency to respect Firecrawl rate limits, matching
+        # the sync path's worker cap
+        semaphore = asyncio.Semaphore(min(len(sites_to_search), 4))
+
+        async def extract_site(site, url):
+            async with semaphore:
+                properties, total_count = await asyncio.to_thread(self._extract_single_url, url, prompt)
+                return site, properties, total_count
+
+        logger.debug("Calling Firecrawl with %d URLs in parallel", len(sites_to_search))
+        tasks = [asyncio.create_task(extract_site(site, url)) for site, url in sites_to_search]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                yield await completed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def afind_properties_direct(self, city: str, state: str, user_criteria: dict, selected_websites: list) -> dict:
+        """
+        Async variant of find_properties_direct that extracts all selected
+        websites concurrently instead of one after another.
+
+        Args:
+            city: City name for property search
+            state: State abbreviation
+            user_criteria: Dictionary containing user search criteria
+            selected_websites: List of selected real estate websites to search
+
+        Returns:
+            Dictionary with search results or error information
+        """
+        if not self._build_search_urls(city, state, selected_websites):
+            return {"error": "No websites selected"}
+
+        properties = []
+        total_count = 0
+        try:
+            async for _, site_properties, site_total in self.afind_properties_stream(
+                    city, state, user_criteria, selected_websites):
+                properties.extend(site_properties)
+                total_count += site_total
+
+            return self._build_result(properties, total_count, selected_websites, len(selected_websites))
+
         except Exception as e:
             return {"error": f"Firecrawl extraction failed: {str(e)}\n\nPlease check your API keys and try again."}
@@ -1,8 +1,16 @@
 """
 Streamlit UI components for displaying property listings and analysis.
 """
+import re
+from collections import Counter
 import streamlit as st
-from utils import extract_property_valuation
+from utils import build_valuation_index, extract_property_valuation
+
+# Pulls digit runs out of price strings like "$1,250,000"
+_DIGITS_RE = re.compile(r'[0-9]+')
+
+# Fields consumed by the property display
+_FIELDS = ('address', 'price', 'property_type', 'bedrooms', 'bathrooms', 'square_feet', 'description', 'listing_url')
 
 
 def display_properties_professionally(properties, market_analysis, property_valuations, total_properties):
@@ -16,80 +24,79 @@ def display_properties_professionally(properties, market_analysis, property_valu
         total_properties: Total number of properties found
     """
     
+    # Normalize to plain dicts once so every loop below is type-stable
+    # and uses direct dict lookups instead of per-field isinstance checks
+    if properties and not isinstance(properties[0], dict):
+        properties = [{k: getattr(p, k, '') for k in _FIELDS} for p in properties]
+
+    # Single pass over the property list for all header metrics
+    price_total = 0
+    price_count = 0
+    types = Counter()
+    for p in properties:
+        price_str = p.get('price', '')
+        if price_str and price_str != 'Price not available':
+            digits = _DIGITS_RE.findall(str(price_str))
+            if digits:
+                price_total += int(''.join(digits))
+                price_count += 1
+        types[p.get('property_type') or 'Unknown'] += 1
+
     # Header with key metrics
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric("Properties Found", total_properties)
     with col2:
-        # Calculate average price
-        prices = []
-        for p in properties:
-            price_str = p.get('price', '') if isinstance(p, dict) else getattr(p, 'price', '')
-            if price_str and price_str != 'Price not available':
-                try:
-                    price_num = ''.join(filter(str.isdigit, str(price_str)))
-                    if price_num:
-                        prices.append(int(price_num))
-                except:
-                    pass
-        avg_price = f"${sum(prices) // len(prices):,}" if prices else "N/A"
+        avg_price = f"${price_total // price_count:,}" if price_count else "N/A"
         st.metric("Average Price", avg_price)
     with col3:
-        types = {}
-        for p in properties:
-            t = p.get('property_type', 'Unknown') if isinstance(p, dict) else getattr(p, 'property_type', 'Unknown')
-            types[t] = types.get(t, 0) + 1
-        most_common = max(types.items(), key=lambda x: x[1])[0] if types else "N/A"
+        most_common = types.most_common(1)[0][0] if types else "N/A"
         st.metric("Most Common Type", most_common)
     
     # Create tabs for different views
     tab1, tab2, tab3 = st.tabs(["🏠 Properties", "📊 Market Analysis", "💰 Valuations"])
     
     with tab1:
+        # Index the valuation text once; per-property lookup is then O(1)
+        valuation_index = build_valuation_index(property_valuations)
+        # Accumulate all property cards and render them with one
+        # st.markdown call: each Streamlit element is a separate frontend
+        # message, so one blob instead of ~8 widgets per property cuts
+        # render time sharply on large result sets
+        parts = []
         for i, prop in enumerate(properties, 1):
             # Extract property data
-            data = {k: prop.get(k, '') if isinstance(prop, dict) else getattr(prop, k, '') 
-                   for k in ['address', 'price', 'property_type', 'bedrooms', 'bathrooms', 'square_feet', 'description', 'listing_url']}
-            
-            with st.container():
-                # Property header with number and price
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.subheader(f"#{i} 🏠 {data['address']}")
-                with col2:
-                    st.metric("Price", data['price'])
-                
-                # Property details with right-aligned button
-                col1, col2, col3 = st.columns([2, 2, 1])
-                with col1:
-                    st.markdown(f"**Type:** {data['property_type']}")
-                    st.markdown(f"**Beds/Baths:** {data['bedrooms']}/{data['bathrooms']}")
-                    st.markdown(f"**Area:** {data['square_feet']}")
-                with col2:
-                    with st.expander("💰 Investment Analysis"):
-                        # Extract property-specific valuation from the full analysis
-                        property_valuation = extract_property_valuation(property_valuations, i, data['address'])
-                        if property_valuation:
-                            st.markdown(property_valuation)
-                        else:
-                            st.info("Investment analysis not available for this property")
-                with col3:
-                    if data['listing_url'] and data['listing_url'] != '#':
-                        st.markdown(
-                            f"""
-                            <div style="height: 100%; display: flex; align-items: center; justify-content: flex-end;">
-                                <a href="{data['listing_url']}" target="_blank" 
-                                   style="text-decoration: none; padding: 0.5rem 1rem; 
-                                   background-color: #0066cc; color: white; 
-                                   border-radius: 6px; font-size: 0.9em; font-weight: 500;">
-                                    Property Link
-                                </a>
-                            </div>
-                            """,
-                            unsafe_allow_html=True
-                        )
-                
-                st.divider()
+            data = {k: prop.get(k, '') for k in _FIELDS}
+
+            # Indexed lookup first; fall back to the text scan only when
+            # numbered section headers are missing
+            property_valuation = (valuation_index.get(i)
+                                  or extract_property_valuation(property_valuations, i, data['address'])
+                                  or "Investment analysis not available for this property")
+
+            link_html = ""
+            if data['listing_url'] and data['listing_url'] != '#':
+                link_html = (
+                    f'<a href="{data["listing_url"]}" target="_blank" '
+                    'style="text-decoration: none; padding: 0.4rem 0.9rem; '
+                    'background-color: #0066cc; color: white; '
+                    'border-radius: 6px; font-size: 0.9em; font-weight: 500;">'
+                    'Property Link</a>'
+                )
+
+            parts.append(
+                f"### #{i} 🏠 {data['address']} — {data['price']}\n\n"
+                f"**Type:** {data['property_type']} &nbsp;|&nbsp; "
+                f"**Beds/Baths:** {data['bedrooms']}/{data['bathrooms']} &nbsp;|&nbsp; "
+                f"**Area:** {data['square_feet']}\n\n"
+                "<details><summary>💰 Investment Analysis</summary>\n\n"
+                f"{property_valuation}\n\n"
+                "</details>\n\n"
+                f"{link_html}\n\n"
+                "---"
+            )
+
+        st.markdown('\n'.join(parts), unsafe_allow_html=True)
     
     with tab2:
         st.subheader("📊 Market Analysis")
@@ -1,6 +1,6 @@
 """
 Utility functions for the Real Estate Agent application.
 """
-from .helpers import extract_property_valuation
+from .helpers import build_valuation_index, extract_property_valuation
 
-__all__ = ['extract_property_valuation']
+__all__ = ['build_valuation_index', 'extract_property_valuation']
@@ -1,12 +1,50 @@
 """
 Helper functions for property analysis and data processing.
 """
+from functools import lru_cache
 
 
+@lru_cache(maxsize=16)
+def build_valuation_index(property_valuations):
+    """
+    Build a lookup from property number to its valuation section.
+
+    The full valuation text is split once, so the render loop can fetch
+    each property's section in O(1) instead of re-scanning the whole
+    text per property. Memoized across Streamlit reruns; callers must
+    treat the returned dictionary as read-only.
+
+    Args:
+        property_valuations: Full property valuation text
+
+    Returns:
+        Dictionary mapping property number to its valuation section
+    """
+    index = {}
+    if not property_valuations:
+        return index
+
+    for section in property_valuations.split('**Property')[1:]:
+        number_part = section.split(':', 1)[0].strip()
+        try:
+            number = int(number_part)
+        except ValueError:
+            continue
+        clean_section = f"**Property{section}".strip()
+        index.setdefault(number, clean_section.replace('***', '**'))
+
+    return index
+
+
+@lru_cache(maxsize=256)
 def extract_property_valuation(property_valuations, property_number, property_address):
     """
     Extract valuation for a specific property from the full analysis.
-    
+
+    Memoized: Streamlit reruns the render on every interaction, and the
+    arguments are plain strings and ints, so repeated scans of the same
+    valuation text hit the cache instead.
+
     Args:
         property_valuations: Full property valuation text
         property_number: Property number to extract
@@ -24,11 +62,8 @@ def extract_property_valuation(property_valuations, property_number, property_ad
     # Look for the specific property number
     for section in sections:
         if section.strip().startswith(f"{property_number}:"):
-            # Add back the "**Property" prefix and clean up
-            clean_section = f"**Property{section}".strip()
-            # Remove any extra asterisks at the end
-            clean_section = clean_section.replace('**', '**').replace('***', '**')
-            return clean_section
+            # Add back the "**Property" prefix and collapse stray asterisks
+            return f"**Property{section}".rstrip().replace('***', '**')
     
     # Fallback: look for property number mentions in any format
     all_sections = property_valuations.split('\n\n')
@@ -37,10 +72,13 @@ def extract_property_valuation(property_valuations, property_number, property_ad
             f"#{property_number}" in section):
             return section
     
-    # Last resort: try to match by address
-    for section in all_sections:
-        if any(word in section.lower() for word in property_address.lower().split()[:3] if len(word) > 2):
-            return section
+    # Last resort: match by address tokens. Set intersection against each
+    # section's token set replaces repeated substring scans of the text
+    addr_tokens = {word for word in property_address.lower().split()[:3] if len(word) > 2}
+    if addr_tokens:
+        for section in all_sections:
+            if addr_tokens & set(section.lower().split()):
+                return section
     
     # If no specific match found, return indication that analysis is not available
     return f"**Property {property_number} Analysis**\n• Analysis: Individual assessment not available\n• Recommendation: Review general market analysis in the Market Analysis tab"